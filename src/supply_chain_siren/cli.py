@@ -1,21 +1,28 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+import orjson
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from .models import PackageAssessment
-from .osint import fetch_metadata
+from .models import DependencySpec, PackageAssessment
+from .osint import fetch_all
 from .parsers import discover_manifests, parse_manifest
 from .scoring import assess_dependency
 
 console = Console()
 
+# Below this many manifests, process pool start-up costs more than it saves.
+PARALLEL_PARSE_THRESHOLD = 8
+
 
 def cli(
     path: Path = typer.Argument(Path("."), exists=True, resolve_path=True, help="Folder to scan."),
@@ -30,7 +37,7 @@ def cli(
         raise typer.Exit(code=1)
 
     console.print(f"[bold cyan]Discovered {len(manifests)} manifest(s). Starting analysis...[/]")
-    assessments: dict[str, PackageAssessment] = {}
+    dependencies: dict[str, DependencySpec] = {}
 
     with Progress(
         SpinnerColumn(spinner_name="line"),
@@ -39,10 +46,10 @@ def cli(
         transient=True,
     ) as progress:
         task = progress.add_task("Collecting dependencies", total=len(manifests))
-        for manifest in manifests:
-            specs = parse_manifest(manifest)
+        for specs in _parse_manifests(manifests):
             for spec in specs:
-                assessments.setdefault(spec.slug, PackageAssessment(dependency=spec))
+                if spec.slug not in dependencies:
+                    dependencies[spec.slug] = spec
             progress.advance(task)
 
     with Progress(
@@ -50,20 +57,30 @@ def cli(
         TextColumn("{task.description}"),
         console=console,
     ) as progress:
-        task = progress.add_task("Contacting registries", total=len(assessments))
-        for slug, assessment in assessments.items():
-            metadata = fetch_metadata(assessment.dependency)
-            enriched = assess_dependency(assessment.dependency, metadata)
-            assessments[slug] = enriched
-            progress.advance(task)
+        task = progress.add_task("Contacting registries", total=len(dependencies))
+        results = asyncio.run(
+            fetch_all(dependencies.values(), on_complete=lambda: progress.advance(task))
+        )
+        now = datetime.now(timezone.utc)
+        assessments = [
+            assess_dependency(spec, results.get(slug), now) for slug, spec in dependencies.items()
+        ]
 
-    _render_table(list(assessments.values()))
+    _render_table(assessments)
 
     if output:
-        _write_report(output, list(assessments.values()))
+        _write_report(output, assessments)
         console.print(f"[green]Report exported to[/] {output}")
 
 
+def _parse_manifests(manifests: list[Path]) -> Iterator[list[DependencySpec]]:
+    if len(manifests) <= PARALLEL_PARSE_THRESHOLD:
+        yield from map(parse_manifest, manifests)
+        return
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(parse_manifest, manifests, chunksize=4)
+
+
 def _render_table(assessments: list[PackageAssessment]) -> None:
     if not assessments:
         console.print("[green]No dependencies evaluated.[/]")
@@ -85,18 +102,21 @@ def _render_table(assessments: list[PackageAssessment]) -> None:
 
 
 def _write_report(path: Path, assessments: list[PackageAssessment]) -> None:
-    payload = []
-    for assessment in assessments:
-        payload.append(
-            {
-                "dependency": assessment.dependency.model_dump(),
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Stream one entry at a time so the full report never exists in memory twice.
+    with path.open("wb") as report:
+        report.write(b"[")
+        for index, assessment in enumerate(assessments):
+            if index:
+                report.write(b",")
+            entry = {
+                "dependency": dataclasses.asdict(assessment.dependency),
                 "metadata": assessment.metadata.model_dump() if assessment.metadata else None,
-                "signals": [signal.model_dump() for signal in assessment.signals],
+                "signals": [dataclasses.asdict(signal) for signal in assessment.signals],
                 "score": assessment.score,
             }
-        )
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+            report.write(orjson.dumps(entry, default=str))
+        report.write(b"]")
 
 
 def main() -> None:
@@ -1,28 +1,34 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Literal
+from typing import Literal
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field
 
 Ecosystem = Literal["pypi", "npm"]
+SignalCategory = Literal[
+    "typosquat", "fresh-release", "stale-package", "metadata-gaps", "popularity", "maintainers"
+]
 
 
-class DependencySpec(BaseModel):
-    """Represents a dependency discovered in a manifest."""
+@dataclass(slots=True, kw_only=True)
+class DependencySpec:
+    """Represents a dependency discovered in a manifest.
 
-    name: str = Field(..., description="Package identifier as declared in the manifest.")
-    version: str | None = Field(
-        default=None, description="Pinned version where available; None for non-pinned specs."
-    )
-    ecosystem: Ecosystem = Field(..., description="Ecosystem the dependency belongs to.")
-    source_path: Path = Field(..., description="Manifest file the dependency originated from.")
+    ``version`` is the pinned version where available and None for non-pinned
+    specs; ``source_path`` is the manifest the dependency originated from.
+    """
 
-    @computed_field
-    @property
-    def slug(self) -> str:
-        return f"{self.ecosystem}:{self.name.lower()}"
+    name: str
+    version: str | None = None
+    ecosystem: Ecosystem
+    source_path: Path
+    slug: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.slug = f"{self.ecosystem}:{self.name.lower()}"
 
 
 class PackageMetadata(BaseModel):
@@ -37,26 +43,24 @@ class PackageMetadata(BaseModel):
     weekly_downloads: int | None = None
     homepage: str | None = None
     repository_url: str | None = None
-    raw: dict[str, Any] = Field(default_factory=dict)
 
 
-class RiskSignal(BaseModel):
-    """Single risk factor identified during analysis."""
+@dataclass(slots=True)
+class RiskSignal:
+    """Single risk factor identified during analysis, scored on a 0-100 scale."""
 
     reason: str
-    score: int = Field(ge=0, le=100, description="Severity of the signal on a 0-100 scale.")
-    category: Literal[
-        "typosquat", "fresh-release", "stale-package", "metadata-gaps", "popularity", "maintainers"
-    ]
+    score: int
+    category: SignalCategory
 
 
-class PackageAssessment(BaseModel):
+@dataclass(slots=True)
+class PackageAssessment:
     dependency: DependencySpec
     metadata: PackageMetadata | None = None
-    signals: list[RiskSignal] = Field(default_factory=list)
+    signals: list[RiskSignal] = field(default_factory=list)
     score: int = 0
 
     def add_signal(self, signal: RiskSignal) -> None:
         self.signals.append(signal)
         self.score = min(100, self.score + signal.score)
-
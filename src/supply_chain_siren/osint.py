@@ -1,18 +1,34 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import os
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 import httpx
+import orjson
 from platformdirs import user_cache_dir
 
+from . import __version__
 from .models import DependencySpec, PackageMetadata
 from .utils import load_resource_json
 
 CACHE_TTL_SECONDS = 6 * 60 * 60  # 6 hours
+NEGATIVE_CACHE_TTL_SECONDS = 60 * 60  # 1 hour for packages the registry does not know
+CACHE_FLUSH_INTERVAL = 100  # persist after this many unsaved writes
 HTTP_TIMEOUT = 10.0
+HTTP_HEADERS = {"user-agent": f"supply-chain-siren/{__version__}"}
+# A single HTTP/2 connection per registry multiplexes every request; the pool
+# only grows past that for HTTP/1.1 fallbacks.
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+MAX_CONCURRENT_REQUESTS = 16
+NPM_BULK_DOWNLOADS_LIMIT = 128  # npm rejects bulk queries above 128 packages
+
+# Returned by MetadataCache.get for a package recently confirmed missing upstream.
+KNOWN_MISSING = object()
 
 
 class MetadataCache:
@@ -21,41 +37,118 @@ class MetadataCache:
         cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = cache_dir / "registry_cache.json"
         try:
-            self.payload = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            self.payload = orjson.loads(self.cache_file.read_bytes())
         except FileNotFoundError:
             self.payload = {}
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             self.payload = {}
+        self._dirty = False
+        self._pending_writes = 0
 
-    def get(self, key: str) -> dict[str, Any] | None:
+    def get(self, key: str) -> dict[str, Any] | object | None:
         entry = self.payload.get(key)
         if not entry:
             return None
-        if time.time() - entry.get("timestamp", 0) > CACHE_TTL_SECONDS:
+        if time.time() - entry.get("timestamp", 0) > entry.get("ttl", CACHE_TTL_SECONDS):
             return None
-        return entry.get("data")
-
-    def set(self, key: str, data: dict[str, Any]) -> None:
-        self.payload[key] = {"timestamp": time.time(), "data": data}
-        self.cache_file.write_text(json.dumps(self.payload, indent=2), encoding="utf-8")
+        data = entry.get("data")
+        return KNOWN_MISSING if data is None else data
+
+    def set(self, key: str, data: dict[str, Any] | None, ttl: int = CACHE_TTL_SECONDS) -> None:
+        """Store ``data`` for ``key``; pass None to record that the package does not exist."""
+        self.payload[key] = {"timestamp": time.time(), "data": data, "ttl": ttl}
+        self._dirty = True
+        self._pending_writes += 1
+        if self._pending_writes >= CACHE_FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Persist the in-memory cache, replacing the file atomically."""
+        if not self._dirty:
+            return
+        tmp_file = self.cache_file.with_suffix(".tmp")
+        tmp_file.write_bytes(orjson.dumps(self.payload, option=orjson.OPT_NON_STR_KEYS))
+        os.replace(tmp_file, self.cache_file)
+        self._dirty = False
+        self._pending_writes = 0
+
+
+def _index_by_length(names: tuple[str, ...]) -> dict[int, list[str]]:
+    index: dict[int, list[str]] = {}
+    for name in names:
+        index.setdefault(len(name), []).append(name)
+    return index
 
 
 _cache = MetadataCache()
-_client = httpx.Client(timeout=HTTP_TIMEOUT)
-_top_packages = load_resource_json("data/top_packages.json")
+atexit.register(_cache.flush)
+_top_packages: dict[str, tuple[str, ...]] = {
+    ecosystem: tuple(names)
+    for ecosystem, names in load_resource_json("data/top_packages.json").items()
+}
+_top_package_sets = {ecosystem: frozenset(names) for ecosystem, names in _top_packages.items()}
+_top_packages_by_length = {
+    ecosystem: _index_by_length(names) for ecosystem, names in _top_packages.items()
+}
 
 
 def fetch_metadata(spec: DependencySpec) -> PackageMetadata | None:
+    return asyncio.run(fetch_all([spec]))[spec.slug]
+
+
+async def fetch_all(
+    specs: Iterable[DependencySpec], on_complete: Callable[[], None] | None = None
+) -> dict[str, PackageMetadata | None]:
+    """Fetch metadata for every spec concurrently, keyed by slug."""
+    specs = list(specs)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async with _new_client() as client:
+        npm_missing = [
+            spec.name for spec in specs if spec.ecosystem == "npm" and _cache.get(spec.slug) is None
+        ]
+        npm_downloads = await _fetch_npm_downloads_bulk(npm_missing, client, semaphore)
+
+        async def fetch_one(spec: DependencySpec) -> tuple[str, PackageMetadata | None]:
+            async with semaphore:
+                metadata = await fetch_metadata_async(spec, client, npm_downloads)
+            if on_complete:
+                on_complete()
+            return spec.slug, metadata
+
+        results = await asyncio.gather(*(fetch_one(spec) for spec in specs))
+    return dict(results)
+
+
+def _new_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=HTTP_TIMEOUT, http2=True, limits=HTTP_LIMITS, headers=HTTP_HEADERS
+    )
+
+
+async def fetch_metadata_async(
+    spec: DependencySpec,
+    client: httpx.AsyncClient,
+    npm_downloads: dict[str, int | None] | None = None,
+) -> PackageMetadata | None:
     key = spec.slug
     cached = _cache.get(key)
+    if cached is KNOWN_MISSING:
+        return None
     if cached:
         return PackageMetadata(**cached)
 
     try:
         if spec.ecosystem == "pypi":
-            metadata = _fetch_pypi(spec)
+            metadata = await _fetch_pypi(spec, client)
         elif spec.ecosystem == "npm":
-            metadata = _fetch_npm(spec)
+            # Names absent from the prefetched map (e.g. a failed bulk chunk) are
+            # looked up individually rather than recorded as having no downloads.
+            if npm_downloads is not None and spec.name in npm_downloads:
+                downloads = npm_downloads[spec.name]
+            else:
+                downloads = await _fetch_npm_downloads(spec.name, client)
+            metadata = await _fetch_npm(spec, client, downloads)
         else:
             return None
     except httpx.HTTPError:
@@ -63,33 +156,35 @@ def fetch_metadata(spec: DependencySpec) -> PackageMetadata | None:
 
     if metadata:
         _cache.set(key, metadata.model_dump(mode="json"))
+    else:
+        _cache.set(key, None, ttl=NEGATIVE_CACHE_TTL_SECONDS)
     return metadata
 
 
-def _fetch_pypi(spec: DependencySpec) -> PackageMetadata | None:
+async def _fetch_pypi(spec: DependencySpec, client: httpx.AsyncClient) -> PackageMetadata | None:
     url = f"https://pypi.org/pypi/{spec.name}/json"
-    resp = _client.get(url)
-    if resp.status_code != 200:
+    resp = await client.get(url)
+    if resp.status_code == 404:
         return None
+    resp.raise_for_status()
 
-    payload = resp.json()
+    payload = orjson.loads(resp.content)
     info = payload.get("info", {})
     releases = payload.get("releases", {})
     latest_version = info.get("version")
 
-    release_times = []
+    # ISO-8601 timestamps in a fixed format order correctly as plain strings.
     first_release = None
-    for version, files in releases.items():
+    latest_published = None
+    for files in releases.values():
         for file_entry in files:
             upload_time = file_entry.get("upload_time_iso_8601")
-            if upload_time:
-                release_times.append(upload_time)
-                if first_release is None or upload_time < first_release:
-                    first_release = upload_time
-
-    latest_published = None
-    if release_times:
-        latest_published = max(release_times)
+            if not upload_time:
+                continue
+            if first_release is None or upload_time < first_release:
+                first_release = upload_time
+            if latest_published is None or upload_time > latest_published:
+                latest_published = upload_time
 
     maintainers = info.get("maintainers") or []
     maintainers = [m.get("name") if isinstance(m, dict) else str(m) for m in maintainers]
@@ -104,16 +199,18 @@ def _fetch_pypi(spec: DependencySpec) -> PackageMetadata | None:
         weekly_downloads=payload.get("last_month_downloads"),
         homepage=info.get("home_page"),
         repository_url=info.get("project_url"),
-        raw=payload,
     )
 
 
-def _fetch_npm(spec: DependencySpec) -> PackageMetadata | None:
+async def _fetch_npm(
+    spec: DependencySpec, client: httpx.AsyncClient, downloads: int | None
+) -> PackageMetadata | None:
     url = f"https://registry.npmjs.org/{spec.name}"
-    resp = _client.get(url)
-    if resp.status_code != 200:
+    resp = await client.get(url)
+    if resp.status_code == 404:
         return None
-    payload = resp.json()
+    resp.raise_for_status()
+    payload = orjson.loads(resp.content)
 
     time_section = payload.get("time", {})
     versions = payload.get("versions", {})
@@ -139,8 +236,6 @@ def _fetch_npm(spec: DependencySpec) -> PackageMetadata | None:
         elif isinstance(maintainer, str):
             maintainers.append(maintainer)
 
-    downloads = _fetch_npm_downloads(spec.name)
-
     version_payload = versions.get(latest, {})
     homepage = version_payload.get("homepage")
     repo = version_payload.get("repository")
@@ -160,22 +255,73 @@ def _fetch_npm(spec: DependencySpec) -> PackageMetadata | None:
         weekly_downloads=downloads,
         homepage=homepage,
         repository_url=repo_url,
-        raw=payload,
     )
 
 
-def _fetch_npm_downloads(package: str) -> int | None:
+async def _fetch_npm_downloads(package: str, client: httpx.AsyncClient) -> int | None:
     url = f"https://api.npmjs.org/downloads/point/last-week/{package}"
     try:
-        resp = _client.get(url)
+        resp = await client.get(url)
         if resp.status_code != 200:
             return None
-        data = resp.json()
+        data = orjson.loads(resp.content)
         return data.get("downloads")
     except httpx.HTTPError:
         return None
 
 
+async def _fetch_npm_downloads_bulk(
+    packages: list[str], client: httpx.AsyncClient, semaphore: asyncio.Semaphore
+) -> dict[str, int | None]:
+    """Resolve weekly downloads for many npm packages with as few requests as possible.
+
+    Packages whose bulk chunk fails are left out of the returned map.
+    """
+    # The bulk endpoint does not accept scoped packages, and a single-name query
+    # answers in the per-package shape, so those go through the regular endpoint.
+    unique = list(dict.fromkeys(packages))
+    scoped = [name for name in unique if name.startswith("@")]
+    unscoped = [name for name in unique if not name.startswith("@")]
+    chunks = [
+        unscoped[i : i + NPM_BULK_DOWNLOADS_LIMIT]
+        for i in range(0, len(unscoped), NPM_BULK_DOWNLOADS_LIMIT)
+    ]
+    singles = scoped + [chunk[0] for chunk in chunks if len(chunk) == 1]
+    bulk_chunks = [chunk for chunk in chunks if len(chunk) > 1]
+
+    async def fetch_chunk(chunk: list[str]) -> dict[str, int | None]:
+        async with semaphore:
+            return await _fetch_npm_downloads_chunk(chunk, client)
+
+    async def fetch_single(name: str) -> int | None:
+        async with semaphore:
+            return await _fetch_npm_downloads(name, client)
+
+    downloads: dict[str, int | None] = {}
+    for result in await asyncio.gather(*(fetch_chunk(chunk) for chunk in bulk_chunks)):
+        downloads.update(result)
+    single_results = await asyncio.gather(*(fetch_single(name) for name in singles))
+    downloads.update(zip(singles, single_results))
+    return downloads
+
+
+async def _fetch_npm_downloads_chunk(
+    packages: list[str], client: httpx.AsyncClient
+) -> dict[str, int | None]:
+    url = f"https://api.npmjs.org/downloads/point/last-week/{','.join(packages)}"
+    try:
+        resp = await client.get(url)
+        if resp.status_code != 200:
+            return {}
+        data = orjson.loads(resp.content)
+    except httpx.HTTPError:
+        return {}
+    return {
+        name: entry.get("downloads") if isinstance(entry, dict) else None
+        for name, entry in data.items()
+    }
+
+
 def _parse_datetime(text: str | None):
     if not text:
         return None
@@ -187,6 +333,28 @@ def _parse_datetime(text: str | None):
         return None
 
 
-def get_top_packages(ecosystem: str) -> list[str]:
-    return _top_packages.get(ecosystem, [])
+def get_top_packages(ecosystem: str) -> tuple[str, ...]:
+    return _top_packages.get(ecosystem, ())
 
+
+def is_top_package(ecosystem: str, name: str) -> bool:
+    return name in _top_package_sets.get(ecosystem, ())
+
+
+def get_top_packages_near(ecosystem: str, name: str, max_distance: int) -> tuple[str, ...]:
+    """Return top packages whose length is within ``max_distance`` of ``name``.
+
+    Any other candidate needs more than ``max_distance`` edits, so it can be
+    skipped without computing a distance.
+    """
+    return _top_packages_near_length(ecosystem, len(name), max_distance)
+
+
+@lru_cache(maxsize=None)
+def _top_packages_near_length(ecosystem: str, length: int, max_distance: int) -> tuple[str, ...]:
+    buckets = _top_packages_by_length.get(ecosystem, {})
+    return tuple(
+        top
+        for size in range(length - max_distance, length + max_distance + 1)
+        for top in buckets.get(size, [])
+    )
@@ -1,34 +1,46 @@
 from __future__ import annotations
 
-import json
+import os
 import re
 from pathlib import Path
 from typing import Iterable
 
+import orjson
+
 from .models import DependencySpec
 
+# Matches one requirement per line across a whole file. Blank and comment lines never
+# match because the name class excludes "#". Runs on raw bytes so only the captured
+# groups are ever decoded.
 RE_REQUIREMENT = re.compile(
-    r"^\s*(?P<name>[A-Za-z0-9_.-]+)"
-    r"(?:\s*(?:==|>=|<=|~=|!=|===)\s*(?P<version>[^\s;]+))?"
-    r"(?:\s*;.*)?$"
+    rb"^[ \t]*(?P<name>[A-Za-z0-9_.-]+)"
+    rb"(?:[ \t]*(?:==|>=|<=|~=|!=|===)[ \t]*(?P<version>[^\s;]+))?"
+    rb"(?:[ \t]*;.*)?[ \t\r]*$",
+    re.ASCII | re.MULTILINE,
 )
 
-
-def discover_manifests(root: Path) -> list[Path]:
-    """Return a list of manifest files we know how to parse."""
-    candidates = [
+MANIFEST_NAMES = frozenset(
+    {
         "requirements.txt",
         "requirements-dev.txt",
         "package-lock.json",
         "package.json",
         "Pipfile.lock",
         "poetry.lock",
-    ]
+    }
+)
+IGNORED_DIRS = frozenset({"node_modules", ".git", ".venv", "venv", "__pycache__", "dist", "build"})
+
+
+def discover_manifests(root: Path) -> list[Path]:
+    """Return a list of manifest files we know how to parse."""
     manifests: list[Path] = []
-    for candidate in candidates:
-        for path in root.rglob(candidate):
-            if path.is_file():
-                manifests.append(path)
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Vendored and build directories hold third-party manifests, not the project's own.
+        dirnames[:] = [name for name in dirnames if name not in IGNORED_DIRS]
+        for filename in filenames:
+            if filename in MANIFEST_NAMES:
+                manifests.append(Path(dirpath, filename))
     return manifests
 
 
@@ -46,37 +58,59 @@ def parse_manifest(path: Path) -> list[DependencySpec]:
 
 
 def _parse_requirements(path: Path) -> Iterable[DependencySpec]:
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        match = RE_REQUIREMENT.match(line)
-        if not match:
-            continue
-        name = match.group("name")
+    text = path.read_bytes()
+    for match in RE_REQUIREMENT.finditer(text):
         version = match.group("version")
-        yield DependencySpec(name=name.lower(), version=version, ecosystem="pypi", source_path=path)
+        yield DependencySpec(
+            name=match.group("name").decode("ascii").lower(),
+            version=version.decode("utf-8") if version is not None else None,
+            ecosystem="pypi",
+            source_path=path,
+        )
 
 
 def _parse_package_lock(path: Path) -> Iterable[DependencySpec]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    dependencies = payload.get("dependencies", {})
-
-    def walk(dep_map: dict[str, dict]) -> Iterable[DependencySpec]:
-        for name, info in dep_map.items():
-            version = info.get("version")
+    payload = orjson.loads(path.read_bytes())
+    # The same transitive package is often installed under many parents; emit it once.
+    seen: set[str] = set()
+
+    # lockfileVersion 2/3 list the whole installed tree flat under "packages",
+    # keyed by install path ("node_modules/a/node_modules/b"; "" is the root).
+    packages = payload.get("packages")
+    if isinstance(packages, dict):
+        for install_path, info in packages.items():
+            # Workspace packages appear as links to local folders, not registry installs.
+            if "node_modules/" not in install_path or info.get("link"):
+                continue
+            # Aliased installs ("node_modules/string-width-cjs") record the real
+            # registry package under "name"; the install path only holds the alias.
+            name = (info.get("name") or install_path.rsplit("node_modules/", 1)[1]).lower()
+            if name in seen:
+                continue
+            seen.add(name)
             yield DependencySpec(
-                name=name.lower(), version=version, ecosystem="npm", source_path=path
+                name=name, version=info.get("version"), ecosystem="npm", source_path=path
             )
+        return
+
+    # lockfileVersion 1 nests transitive dependencies; walk them with an explicit stack.
+    stack = [payload.get("dependencies", {})]
+    while stack:
+        dep_map = stack.pop()
+        for name, info in dep_map.items():
+            name = name.lower()
+            if name not in seen:
+                seen.add(name)
+                yield DependencySpec(
+                    name=name, version=info.get("version"), ecosystem="npm", source_path=path
+                )
             nested = info.get("dependencies")
             if isinstance(nested, dict):
-                yield from walk(nested)
-
-    return walk(dependencies)
+                stack.append(nested)
 
 
 def _parse_package_json(path: Path) -> Iterable[DependencySpec]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = orjson.loads(path.read_bytes())
     dependencies = payload.get("dependencies", {})
     dev_dependencies = payload.get("devDependencies", {})
 
@@ -86,8 +120,8 @@ def _parse_package_json(path: Path) -> Iterable[DependencySpec]:
 
 def _parse_pep_lock(path: Path) -> Iterable[DependencySpec]:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        payload = orjson.loads(path.read_bytes())
+    except orjson.JSONDecodeError:
         return []
 
     if path.name == "Pipfile.lock":
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
+from rapidfuzz import process
 from rapidfuzz.distance import Levenshtein
 
 from .models import DependencySpec, PackageAssessment, PackageMetadata, RiskSignal
-from .osint import get_top_packages
+from .osint import get_top_packages_near, is_top_package
 
 RECENT_THRESHOLD_DAYS = 45
 STALE_THRESHOLD_DAYS = 365
 LOW_DOWNLOADS_THRESHOLD = 500
+TYPOSQUAT_MAX_DISTANCE = 2
 
 
-def assess_dependency(spec: DependencySpec, metadata: PackageMetadata | None) -> PackageAssessment:
+def assess_dependency(
+    spec: DependencySpec, metadata: PackageMetadata | None, now: datetime | None = None
+) -> PackageAssessment:
+    now = now or datetime.now(timezone.utc)
     assessment = PackageAssessment(dependency=spec, metadata=metadata)
 
     if metadata is None:
@@ -25,37 +31,49 @@ def assess_dependency(spec: DependencySpec, metadata: PackageMetadata | None) ->
         )
         return assessment
 
+    recent_cutoff, stale_cutoff = _release_cutoffs(now)
     _evaluate_typosquat(spec, assessment)
-    _evaluate_recency(metadata, assessment)
-    _evaluate_staleness(metadata, assessment)
+    _evaluate_recency(metadata, assessment, recent_cutoff)
+    _evaluate_staleness(metadata, assessment, stale_cutoff)
     _evaluate_popularity(metadata, assessment)
     _evaluate_maintainers(metadata, assessment)
 
     return assessment
 
 
+@lru_cache(maxsize=1)
+def _release_cutoffs(now: datetime) -> tuple[datetime, datetime]:
+    """Return the (fresh-release, stale-package) cutoffs; a scan reuses one ``now``."""
+    return now - timedelta(days=RECENT_THRESHOLD_DAYS), now - timedelta(days=STALE_THRESHOLD_DAYS)
+
+
 def _evaluate_typosquat(spec: DependencySpec, assessment: PackageAssessment) -> None:
-    top_packages = get_top_packages(spec.ecosystem)
-    for top in top_packages:
-        distance = Levenshtein.distance(spec.name, top)
-        if distance == 0:
-            return
-        if distance <= 2:
-            assessment.add_signal(
-                RiskSignal(
-                    reason=f"Name '{spec.name}' is {distance} edits away from popular package '{top}'.",
-                    score=50,
-                    category="typosquat",
-                )
-            )
-            return
+    # Exact top-package names are the only way to reach distance 0, so after this
+    # check any match is a near-miss.
+    if is_top_package(spec.ecosystem, spec.name):
+        return
+    top_packages = get_top_packages_near(spec.ecosystem, spec.name, TYPOSQUAT_MAX_DISTANCE)
+    match = process.extractOne(
+        spec.name, top_packages, scorer=Levenshtein.distance, score_cutoff=TYPOSQUAT_MAX_DISTANCE
+    )
+    if match is None:
+        return
+    top, distance, _ = match
+    assessment.add_signal(
+        RiskSignal(
+            reason=f"Name '{spec.name}' is {distance} edits away from popular package '{top}'.",
+            score=50,
+            category="typosquat",
+        )
+    )
 
 
-def _evaluate_recency(metadata: PackageMetadata, assessment: PackageAssessment) -> None:
+def _evaluate_recency(
+    metadata: PackageMetadata, assessment: PackageAssessment, recent_cutoff: datetime
+) -> None:
     if metadata.first_published is None:
         return
-    now = datetime.now(timezone.utc)
-    if now - metadata.first_published <= timedelta(days=RECENT_THRESHOLD_DAYS):
+    if metadata.first_published >= recent_cutoff:
         assessment.add_signal(
             RiskSignal(
                 reason="Package is newly published; consider additional vetting.",
@@ -65,11 +83,12 @@ def _evaluate_recency(metadata: PackageMetadata, assessment: PackageAssessment)
         )
 
 
-def _evaluate_staleness(metadata: PackageMetadata, assessment: PackageAssessment) -> None:
+def _evaluate_staleness(
+    metadata: PackageMetadata, assessment: PackageAssessment, stale_cutoff: datetime
+) -> None:
     if metadata.latest_published is None:
         return
-    now = datetime.now(timezone.utc)
-    if now - metadata.latest_published >= timedelta(days=STALE_THRESHOLD_DAYS):
+    if metadata.latest_published <= stale_cutoff:
         assessment.add_signal(
             RiskSignal(
                 reason="Latest release is over a year old; project may be unmaintained.",
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from supply_chain_siren import osint
+from supply_chain_siren.models import DependencySpec
+
+
+def test_cache_defers_writes_until_flush(tmp_path, monkeypatch):
+    monkeypatch.setattr(osint, "user_cache_dir", lambda _: str(tmp_path))
+    cache = osint.MetadataCache()
+
+    cache.set("pypi:requests", {"name": "requests"})
+    assert not cache.cache_file.exists()
+
+    cache.flush()
+    payload = json.loads(cache.cache_file.read_text(encoding="utf-8"))
+    assert payload["pypi:requests"]["data"] == {"name": "requests"}
+    assert osint.MetadataCache().get("pypi:requests") == {"name": "requests"}
+
+
+def test_cache_records_known_missing_packages(tmp_path, monkeypatch):
+    monkeypatch.setattr(osint, "user_cache_dir", lambda _: str(tmp_path))
+    cache = osint.MetadataCache()
+
+    cache.set("pypi:reqeusts", None, ttl=60)
+    assert cache.get("pypi:reqeusts") is osint.KNOWN_MISSING
+
+    cache.payload["pypi:reqeusts"]["timestamp"] -= 61
+    assert cache.get("pypi:reqeusts") is None
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    """Route registry traffic to a mock transport and isolate the cache."""
+    monkeypatch.setattr(osint, "user_cache_dir", lambda _: str(tmp_path))
+    monkeypatch.setattr(osint, "_cache", osint.MetadataCache())
+    requests: list[str] = []
+    responses: dict[str, tuple[int, object]] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        requests.append(url)
+        status, payload = responses.get(url, (404, None))
+        return httpx.Response(status, json=payload)
+
+    monkeypatch.setattr(
+        osint, "_new_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return requests, responses
+
+
+def _spec(name: str, ecosystem: str = "pypi") -> DependencySpec:
+    return DependencySpec(name=name, ecosystem=ecosystem, source_path=Path("requirements.txt"))
+
+
+def test_fetch_all_keys_results_by_slug(registry):
+    requests, responses = registry
+    responses["https://pypi.org/pypi/requests/json"] = (200, {"info": {"version": "2.31.0"}})
+    osint._cache.set("pypi:numpy", {"name": "numpy", "ecosystem": "pypi"})
+    completed = []
+
+    specs = [_spec("requests"), _spec("numpy")]
+
+    results = asyncio.run(osint.fetch_all(specs, on_complete=lambda: completed.append(1)))
+
+    assert set(results) == {"pypi:requests", "pypi:numpy"}
+    assert results["pypi:requests"].latest_version == "2.31.0"
+    assert results["pypi:numpy"].name == "numpy"
+    assert len(completed) == 2
+    assert requests == ["https://pypi.org/pypi/requests/json"]
+
+
+def test_npm_downloads_bulk_chunking_and_fallbacks():
+    requested: list[list[str]] = []
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        path = request.url.path.removeprefix("/downloads/point/last-week/")
+        names = path.split(",") if not path.startswith("@") else [path]
+        requested.append(names)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if len(names) == 1:
+            return httpx.Response(200, json={"downloads": 1, "package": names[0]})
+        return httpx.Response(200, json={name: {"downloads": 2} for name in names})
+
+    unscoped = [f"pkg-{i}" for i in range(129)]
+    scoped = [f"@types/pkg-{i}" for i in range(40)]
+
+    async def run() -> dict[str, int | None]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            semaphore = asyncio.Semaphore(4)
+            return await osint._fetch_npm_downloads_bulk(unscoped + scoped, client, semaphore)
+
+    downloads = asyncio.run(run())
+
+    assert sorted(len(names) for names in requested if len(names) > 1) == [128]
+    assert ["pkg-128"] in requested
+    assert downloads["pkg-0"] == 2
+    assert downloads["pkg-128"] == 1
+    assert all(downloads[name] == 1 for name in scoped)
+    assert peak <= 4
+
+
+def test_failed_bulk_chunk_falls_back_to_per_package(registry):
+    requests, responses = registry
+    for name in ("left-pad", "is-odd"):
+        responses[f"https://registry.npmjs.org/{name}"] = (200, {"dist-tags": {"latest": "1.0.0"}})
+        responses[f"https://api.npmjs.org/downloads/point/last-week/{name}"] = (
+            200,
+            {"downloads": 1000, "package": name},
+        )
+
+    results = asyncio.run(osint.fetch_all([_spec("left-pad", "npm"), _spec("is-odd", "npm")]))
+
+    assert "https://api.npmjs.org/downloads/point/last-week/left-pad,is-odd" in requests
+    assert results["npm:left-pad"].weekly_downloads == 1000
+    assert results["npm:is-odd"].weekly_downloads == 1000
+
+
+def test_fetch_all_caches_404_but_retries_server_errors(registry):
+    requests, responses = registry
+    responses["https://pypi.org/pypi/flaky/json"] = (503, None)
+    specs = [_spec("reqeusts"), _spec("flaky")]
+
+    first = asyncio.run(osint.fetch_all(specs))
+    assert first == {"pypi:reqeusts": None, "pypi:flaky": None}
+    assert osint._cache.get("pypi:reqeusts") is osint.KNOWN_MISSING
+    assert osint._cache.get("pypi:flaky") is None
+
+    requests.clear()
+    asyncio.run(osint.fetch_all(specs))
+    assert requests == ["https://pypi.org/pypi/flaky/json"]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 
-from supply_chain_siren.parsers import parse_manifest
+from supply_chain_siren.parsers import discover_manifests, parse_manifest
 
 
 def test_parse_requirements(tmp_path):
@@ -15,6 +15,28 @@ def test_parse_requirements(tmp_path):
     assert deps[0].ecosystem == "pypi"
 
 
+def test_parse_requirements_line_forms(tmp_path):
+    manifest = tmp_path / "requirements.txt"
+    manifest.write_bytes(
+        b"Django==4.2.1\r\n"
+        b"  # indented comment\r\n"
+        b"  flask >= 2.0\r\n"
+        b'pywin32==306 ; sys_platform == "win32"\r\n'
+        b"-r base.txt\r\n"
+        b"\r\n"
+        b"rich\r\n"
+    )
+
+    deps = parse_manifest(manifest)
+
+    assert [(dep.name, dep.version) for dep in deps] == [
+        ("django", "4.2.1"),
+        ("flask", "2.0"),
+        ("pywin32", "306"),
+        ("rich", None),
+    ]
+
+
 def test_parse_package_json(tmp_path):
     payload = {
         "dependencies": {"react": "^18.0.0"},
@@ -27,3 +49,73 @@ def test_parse_package_json(tmp_path):
     assert {dep.name for dep in deps} == {"react", "eslint"}
     assert all(dep.ecosystem == "npm" for dep in deps)
 
+
+def test_discover_manifests_skips_vendored_dirs(tmp_path):
+    (tmp_path / "requirements.txt").write_text("requests\n", encoding="utf-8")
+    (tmp_path / "web").mkdir()
+    (tmp_path / "web" / "package.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "node_modules" / "left-pad").mkdir(parents=True)
+    (tmp_path / "node_modules" / "left-pad" / "package.json").write_text("{}", encoding="utf-8")
+
+    manifests = discover_manifests(tmp_path)
+
+    assert sorted(manifests) == [tmp_path / "requirements.txt", tmp_path / "web" / "package.json"]
+
+
+def test_parse_package_lock_v1_nested(tmp_path):
+    payload = {
+        "lockfileVersion": 1,
+        "dependencies": {
+            "express": {
+                "version": "4.18.2",
+                "dependencies": {"debug": {"version": "2.6.9"}},
+            },
+        },
+    }
+    manifest = tmp_path / "package-lock.json"
+    manifest.write_text(json.dumps(payload), encoding="utf-8")
+
+    deps = parse_manifest(manifest)
+
+    assert {(dep.name, dep.version) for dep in deps} == {("express", "4.18.2"), ("debug", "2.6.9")}
+
+
+def test_parse_package_lock_v3_packages(tmp_path):
+    payload = {
+        "lockfileVersion": 3,
+        "packages": {
+            "": {"name": "app", "version": "1.0.0"},
+            "node_modules/@types/node": {"version": "20.1.0"},
+            "node_modules/express/node_modules/debug": {"version": "2.6.9"},
+            "node_modules/string-width-cjs": {"name": "string-width", "version": "4.2.3"},
+            "node_modules/@acme/ui": {"resolved": "packages/ui", "link": True},
+            "packages/ui": {"name": "@acme/ui", "version": "0.1.0"},
+        },
+    }
+    manifest = tmp_path / "package-lock.json"
+    manifest.write_text(json.dumps(payload), encoding="utf-8")
+
+    deps = parse_manifest(manifest)
+
+    assert {(dep.name, dep.version) for dep in deps} == {
+        ("@types/node", "20.1.0"),
+        ("debug", "2.6.9"),
+        ("string-width", "4.2.3"),
+    }
+
+
+def test_parse_package_lock_emits_each_package_once(tmp_path):
+    payload = {
+        "lockfileVersion": 3,
+        "packages": {
+            "node_modules/a/node_modules/debug": {"version": "2.6.9"},
+            "node_modules/b/node_modules/debug": {"version": "2.6.9"},
+            "node_modules/debug-legacy": {"name": "debug", "version": "2.6.9"},
+        },
+    }
+    manifest = tmp_path / "package-lock.json"
+    manifest.write_text(json.dumps(payload), encoding="utf-8")
+
+    deps = parse_manifest(manifest)
+
+    assert [dep.name for dep in deps] == ["debug"]
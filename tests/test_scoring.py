@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 
 from pathlib import Path
 
+from supply_chain_siren import scoring
 from supply_chain_siren.models import DependencySpec, PackageMetadata
 from supply_chain_siren.scoring import assess_dependency
 
@@ -25,3 +26,41 @@ def test_typosquat_detection(monkeypatch):
     assert any(signal.category == "typosquat" for signal in assessment.signals)
     assert assessment.score > 0
 
+
+def test_popular_package_is_not_typosquat(monkeypatch):
+    spec = DependencySpec(
+        name="requests", version="2.31.0", ecosystem="pypi", source_path=Path(__file__)
+    )
+    metadata = PackageMetadata(name="requests", ecosystem="pypi", maintainers=["a", "b"])
+
+    def fail(*args):
+        raise AssertionError("exact top-package names must skip fuzzy matching")
+
+    monkeypatch.setattr(scoring, "get_top_packages_near", fail)
+    assessment = assess_dependency(spec, metadata)
+
+    assert not any(signal.category == "typosquat" for signal in assessment.signals)
+
+
+def test_release_age_is_measured_against_supplied_now():
+    now = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    spec = DependencySpec(
+        name="pandas", version="1.0", ecosystem="pypi", source_path=Path(__file__)
+    )
+    metadata = PackageMetadata(
+        name="pandas",
+        ecosystem="pypi",
+        first_published=datetime(2024, 5, 1, tzinfo=timezone.utc),
+        latest_published=datetime(2023, 5, 1, tzinfo=timezone.utc),
+        maintainers=["a", "b"],
+    )
+
+    assessment = assess_dependency(spec, metadata, now=now)
+
+    assert {signal.category for signal in assessment.signals} == {"fresh-release", "stale-package"}
+
+
+def test_release_cutoffs_are_computed_once_per_now():
+    now = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+    assert scoring._release_cutoffs(now) is scoring._release_cutoffs(now)